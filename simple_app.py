@@ -1,82 +1,312 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import functools
 import numpy as np
-import subprocess
-import re
-import random
-from collections import OrderedDict
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import vm_kernels
+
+# How long a scanned process table stays fresh before rereading /proc
+_PS_CACHE_TTL = 2.0
+
+def _scan_proc():
+    """Read the process table straight from /proc: no fork, no ps parsing.
+
+    Returns the same pid/cpu/mem/name dicts the old ps output produced,
+    sorted by memory usage.
+    """
+    clk_tck = os.sysconf('SC_CLK_TCK')
+    page_kb = os.sysconf('SC_PAGE_SIZE') // 1024
+    with open('/proc/uptime') as f:
+        uptime = float(f.read().split()[0])
+    with open('/proc/meminfo') as f:
+        total_kb = int(f.readline().split()[1])
+
+    processes = []
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/stat', 'rb') as f:
+                stat = f.read()
+            with open(f'/proc/{entry.name}/statm', 'rb') as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue  # process exited mid-scan
+        # comm may itself contain spaces or parens; it ends at the last ')'
+        head, _, tail = stat.rpartition(b')')
+        name = head.split(b'(', 1)[1].decode(errors='replace')
+        fields = tail.split()
+        utime = int(fields[11])
+        stime = int(fields[12])
+        starttime = int(fields[19])
+        elapsed = uptime - starttime / clk_tck
+        cpu = 100.0 * (utime + stime) / clk_tck / elapsed if elapsed > 0 else 0.0
+        mem = 100.0 * rss_pages * page_kb / total_kb if total_kb else 0.0
+        processes.append({
+            'pid': entry.name,
+            'cpu': f'{cpu:.1f}',
+            'mem': f'{mem:.1f}',
+            'name': name
+        })
+
+    # Sort by memory usage (highest first)
+    processes.sort(key=lambda p: float(p['mem']), reverse=True)
+    return processes
+
+# Neo-inspired color scheme shared by every simulator window
+_BACKGROUND_COLOR = '#0c1021'  # Dark blue background
+_ACCENT_COLOR = '#00ffff'      # Cyan accent
+_SECONDARY_COLOR = '#007acc'   # Lighter blue
+_TEXT_COLOR = '#ffffff'        # White text
+
+_styles_configured = False
+
+@functools.lru_cache(maxsize=8)
+def _parse_sequence(csv):
+    """Parse a comma-separated page string, memoized on the raw text.
+
+    Toggling only the algorithm or frame count re-runs the simulation
+    with the same entry text; caching the parse makes those re-runs
+    skip the CSV scan entirely.
+    """
+    if not csv.strip():
+        # fromstring reads whitespace-only input as a single zero
+        seq = np.empty(0, dtype=np.int32)
+    else:
+        seq = np.fromstring(csv, sep=',', dtype=np.int32)
+    seq.flags.writeable = False  # cached array is shared across runs
+    return seq
+
+def _configure_styles():
+    """Apply the ttk theme and widget styles once per process."""
+    global _styles_configured
+    if _styles_configured:
+        return
+    style = ttk.Style()
+    if hasattr(style, 'theme_use'):
+        try:
+            style.theme_use('clam')  # Most basic theme available on all platforms
+        except:
+            pass  # Fallback to default if theme not available
+
+    style.configure('TFrame', background=_BACKGROUND_COLOR)
+    style.configure('TLabel', background=_BACKGROUND_COLOR, foreground=_TEXT_COLOR)
+    style.configure('TButton', background=_SECONDARY_COLOR)
+    style.configure('TRadiobutton', background=_BACKGROUND_COLOR, foreground=_TEXT_COLOR)
+    _styles_configured = True
 
 class PageReplacementAlgorithm:
+    # Fixed attribute set: skips the per-instance __dict__ and speeds up
+    # the dotted accesses in the simulation loops
+    __slots__ = ('total_frames', 'memory', 'page_faults', 'state_log',
+                 'fault_log', '_empty_frames', '_future_scratch')
+
     def __init__(self, total_frames):
         self.total_frames = total_frames
         self.memory = [-1] * total_frames
         self.page_faults = 0
-        self.history = []
+        self.state_log = np.empty((0, total_frames), dtype=np.int32)
+        self.fault_log = np.empty(0, dtype=bool)
+        # Shared template so each run resets frames without reallocating
+        self._empty_frames = (-1,) * total_frames
+        # Scratch for the optimal victim search: next-use per frame
+        self._future_scratch = np.empty(total_frames, dtype=np.int64)
+
+    def _replay_jit(self, kernel_fn, page_sequence):
+        """Run a logging kernel and mirror its results onto the instance."""
+        faults, memory, state_log, fault_log = kernel_fn(
+            page_sequence, self.total_frames
+        )
+        self.page_faults = faults
+        self.memory = memory
+        self.state_log = state_log
+        self.fault_log = fault_log
+        return faults, memory, state_log, fault_log
 
-    def lru_replace(self, page_sequence):
-        self.memory = [-1] * self.total_frames
+    def _simulate_counts_only(self, kernel_fn, page_sequence):
+        """Fault count and final memory only, via the non-logging kernels."""
+        faults, resident = kernel_fn(page_sequence, self.total_frames)
+        self.page_faults = faults
+        self.memory = resident + [-1] * (self.total_frames - len(resident))
+        self.state_log = np.empty((0, self.total_frames), dtype=np.int32)
+        self.fault_log = np.empty(0, dtype=bool)
+        return faults, self.memory, self.state_log, self.fault_log
+
+    def lru_replace(self, page_sequence, record_history=True):
+        if vm_kernels.NUMBA_AVAILABLE and len(page_sequence):
+            if not record_history:
+                return self._simulate_counts_only(vm_kernels.lru_simulate, page_sequence)
+            return self._replay_jit(vm_kernels.lru_replay, page_sequence)
+
+        self.memory[:] = self._empty_frames
         self.page_faults = 0
-        access_history = OrderedDict()
-        self.history = []
+        n = len(page_sequence) if record_history else 0
+        # Preallocated history logs: one row per access instead of a
+        # per-step list copy wrapped in a dict
+        self.state_log = np.empty((n, self.total_frames), dtype=np.int32)
+        self.fault_log = np.empty(n, dtype=bool)
+        # Single ordered map page -> frame index: insertion order is the
+        # recency order, so hits relink and evictions pop the front
+        cache = OrderedDict()
+        next_free = 0  # frames fill left to right; the counter is authoritative
 
-        for page in page_sequence:
-            current_state = self.memory.copy()
-            if page not in self.memory:
+        for i, page in enumerate(page_sequence):
+            if record_history:
+                self.state_log[i] = self.memory
+            if page not in cache:
+                if record_history:
+                    self.fault_log[i] = True
                 self.page_faults += 1
-                if -1 in self.memory:
+                if next_free < self.total_frames:
                     # Empty frame available
-                    idx = self.memory.index(-1)
+                    idx = next_free
+                    next_free += 1
                 else:
-                    # Find least recently used
-                    lru_page = next(iter(access_history))
-                    idx = self.memory.index(lru_page)
-                    del access_history[lru_page]
+                    # Evict the least recently used page in O(1)
+                    _, idx = cache.popitem(last=False)
                 self.memory[idx] = page
-            
-            # Update access history
-            if page in access_history:
-                del access_history[page]
-            access_history[page] = True
-            
-            self.history.append({
-                'page': page,
-                'state': current_state.copy(),
-                'fault': page not in current_state
-            })
+                cache[page] = idx
+            else:
+                if record_history:
+                    self.fault_log[i] = False
+                # Promote to most recently used (single C-level call)
+                cache.move_to_end(page)
 
-        return self.page_faults, self.memory, self.history
+        return self.page_faults, self.memory, self.state_log, self.fault_log
 
-    def optimal_replace(self, page_sequence):
-        self.memory = [-1] * self.total_frames
+    def lru_with_lookahead(self, page_sequence, lookahead=16):
+        """LRU that peeks at the next `lookahead` accesses before evicting.
+
+        Unlike optimal_replace this needs no full future knowledge: a
+        sliding multiset of the upcoming window steers eviction away
+        from pages needed soon, giving near-optimal fault counts in
+        O(n * lookahead) instead of consuming the whole trace.
+        """
+        self.memory[:] = self._empty_frames
         self.page_faults = 0
-        self.history = []
+        n = len(page_sequence)
+        self.state_log = np.empty((n, self.total_frames), dtype=np.int32)
+        self.fault_log = np.empty(n, dtype=bool)
+        cache = OrderedDict()  # page -> frame index, insertion order = recency
+        next_free = 0  # frames fill left to right; the counter is authoritative
+
+        # Multiset of the next `lookahead` accesses, slid incrementally
+        window_counts = {}
+        for p in page_sequence[1:1 + lookahead]:
+            window_counts[p] = window_counts.get(p, 0) + 1
 
         for i, page in enumerate(page_sequence):
-            current_state = self.memory.copy()
-            if page not in self.memory:
+            self.state_log[i] = self.memory
+            if page in cache:
+                self.fault_log[i] = False
+                cache.move_to_end(page)
+            else:
+                self.fault_log[i] = True
                 self.page_faults += 1
-                if -1 in self.memory:
+                if next_free < self.total_frames:
                     # Empty frame available
-                    idx = self.memory.index(-1)
+                    idx = next_free
+                    next_free += 1
                 else:
-                    # Find optimal victim
-                    future_use = {}
-                    for p in self.memory:
-                        try:
-                            future_use[p] = page_sequence[i:].index(p)
-                        except ValueError:
-                            future_use[p] = float('inf')
-                    victim = max(future_use.items(), key=lambda x: x[1])[0]
-                    idx = self.memory.index(victim)
+                    # Prefer the least recently used page that the window
+                    # says is not needed soon
+                    victim = None
+                    for p in cache:
+                        if p not in window_counts:
+                            victim = p
+                            break
+                    if victim is None:
+                        # Everything resident reappears in the window:
+                        # evict whichever is used farthest within it.
+                        # Walked backwards so each page keeps its first
+                        # position; sequences are arrays, so there is no
+                        # list.index to lean on
+                        upcoming = page_sequence[i + 1:i + 1 + lookahead]
+                        next_pos = {}
+                        for j in range(len(upcoming) - 1, -1, -1):
+                            next_pos[upcoming[j]] = j
+                        victim = max(cache, key=next_pos.__getitem__)
+                    idx = cache.pop(victim)
                 self.memory[idx] = page
+                cache[page] = idx
+
+            # Slide the window one position forward
+            if i + 1 < n:
+                leaving = page_sequence[i + 1]
+                count = window_counts.get(leaving, 0) - 1
+                if count > 0:
+                    window_counts[leaving] = count
+                else:
+                    window_counts.pop(leaving, None)
+            entering_at = i + 1 + lookahead
+            if entering_at < n:
+                entering = page_sequence[entering_at]
+                window_counts[entering] = window_counts.get(entering, 0) + 1
+
+        return self.page_faults, self.memory, self.state_log, self.fault_log
 
-            self.history.append({
-                'page': page,
-                'state': current_state.copy(),
-                'fault': page not in current_state
-            })
+    def optimal_replace(self, page_sequence, record_history=True):
+        if vm_kernels.NUMBA_AVAILABLE and len(page_sequence):
+            if not record_history:
+                return self._simulate_counts_only(vm_kernels.optimal_simulate, page_sequence)
+            return self._replay_jit(vm_kernels.optimal_replay, page_sequence)
 
-        return self.page_faults, self.memory, self.history
+        self.memory[:] = self._empty_frames
+        self.page_faults = 0
+        n = len(page_sequence)
+        # Preallocated history logs: one row per access instead of a
+        # per-step list copy wrapped in a dict
+        rows = n if record_history else 0
+        self.state_log = np.empty((rows, self.total_frames), dtype=np.int32)
+        self.fault_log = np.empty(rows, dtype=bool)
+
+        # Precompute future access positions per page so victim selection
+        # reads an index instead of rescanning the remaining sequence
+        future_positions = {}
+        for i, page in enumerate(page_sequence):
+            future_positions.setdefault(page, deque()).append(i)
+
+        next_use = {}  # resident page -> next access index (n means "never again")
+        slot_of = {}  # resident page -> frame index (doubles as resident set)
+        next_free = 0  # frames fill left to right; the counter is authoritative
+
+        for i, page in enumerate(page_sequence):
+            positions = future_positions[page]
+            positions.popleft()  # consume the current access
+            upcoming = positions[0] if positions else n
+
+            if record_history:
+                self.state_log[i] = self.memory
+            if page not in slot_of:
+                if record_history:
+                    self.fault_log[i] = True
+                self.page_faults += 1
+                if next_free < self.total_frames:
+                    # Empty frame available
+                    idx = next_free
+                    next_free += 1
+                else:
+                    # Find optimal victim: fill the per-frame scratch with
+                    # next-use indices and take the argmax (farthest future)
+                    scratch = self._future_scratch
+                    for k in range(self.total_frames):
+                        scratch[k] = next_use[self.memory[k]]
+                    idx = int(scratch.argmax())
+                    victim = self.memory[idx]
+                    del slot_of[victim]
+                    del next_use[victim]
+                self.memory[idx] = page
+                slot_of[page] = idx
+            elif record_history:
+                self.fault_log[i] = False
+            next_use[page] = upcoming
+
+        return self.page_faults, self.memory, self.state_log, self.fault_log
 
 class SimpleMemorySimulator:
     def __init__(self, root):
@@ -84,32 +314,34 @@ class SimpleMemorySimulator:
         self.root.title("Simple Virtual Memory Simulator")
         self.root.geometry("900x700")
         
-        # Neo-inspired color scheme
-        self.BACKGROUND_COLOR = '#0c1021'  # Dark blue background
-        self.ACCENT_COLOR = '#00ffff'      # Cyan accent
-        self.SECONDARY_COLOR = '#007acc'   # Lighter blue
-        self.TEXT_COLOR = '#ffffff'        # White text
-        
+        # Colors come from the module-level scheme
+        self.BACKGROUND_COLOR = _BACKGROUND_COLOR
+        self.ACCENT_COLOR = _ACCENT_COLOR
+        self.SECONDARY_COLOR = _SECONDARY_COLOR
+        self.TEXT_COLOR = _TEXT_COLOR
+
         self.root.configure(bg=self.BACKGROUND_COLOR)
-        
+
         # Process tracking variables
         self.process_list = []
         self.last_selected_pid = None
-        
-        # Configure styles
-        style = ttk.Style()
-        if hasattr(style, 'theme_use'):
-            try:
-                style.theme_use('clam')  # Most basic theme available on all platforms
-            except:
-                pass  # Fallback to default if theme not available
-                
-        # Set colors        
-        style.configure('TFrame', background=self.BACKGROUND_COLOR)
-        style.configure('TLabel', background=self.BACKGROUND_COLOR, foreground=self.TEXT_COLOR)
-        style.configure('TButton', background=self.SECONDARY_COLOR)
-        style.configure('TRadiobutton', background=self.BACKGROUND_COLOR, foreground=self.TEXT_COLOR)
-        
+        # (timestamp, scanned table) from the last /proc walk; refreshed on
+        # TTL expiry by a background thread
+        self._ps_cache = None
+        self._proc_scan_running = False
+        self._last_proc_sig = None
+        # Vectorized generator for simulated page access sequences
+        self._rng = np.random.default_rng()
+        # (algorithm, frames, sequence) of the last run plus its outputs;
+        # an unchanged re-run redisplays without simulating again
+        self._last_inputs = None
+        self._last_result = None
+        # Single worker keeps simulations ordered while the UI stays live
+        self._sim_pool = ThreadPoolExecutor(max_workers=1)
+
+        # ttk styles are process-wide; configure them only once
+        _configure_styles()
+
         # Create main container
         main_frame = ttk.Frame(root)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -200,50 +432,63 @@ class SimpleMemorySimulator:
         
     def update_process_list(self):
         """Update the list of running processes"""
+        # Reuse the last scanned table while it is still fresh instead of
+        # walking /proc on every refresh
+        now = time.monotonic()
+        if self._ps_cache is not None and now - self._ps_cache[0] < _PS_CACHE_TTL:
+            self._apply_process_list(self._ps_cache[1])
+            return
+        if self._proc_scan_running:
+            return
+        # Scan on a worker thread so the event loop never stalls on the
+        # /proc reads; results come back via root.after
+        self._proc_scan_running = True
+        threading.Thread(target=self._scan_proc_worker, daemon=True).start()
+
+    def _scan_proc_worker(self):
+        """Worker-thread half of update_process_list."""
         try:
-            # Run ps command to get process information
-            result = subprocess.run(
-                ['ps', '-eo', 'pid,pcpu,pmem,comm'], 
-                capture_output=True, 
-                text=True
-            )
-            
-            if result.returncode != 0:
-                messagebox.showerror("Error", "Failed to get process list")
-                return
-                
-            self.process_list = []
-            # Parse the output, skipping the header line
-            for line in result.stdout.strip().split('\n')[1:]:
-                parts = re.split(r'\s+', line.strip(), maxsplit=3)
-                if len(parts) >= 4:
-                    pid, cpu, mem, name = parts
-                    # Extract the base name from path
-                    base_name = name.split('/')[-1]
-                    self.process_list.append({
-                        'pid': pid,
-                        'cpu': cpu,
-                        'mem': mem,
-                        'name': base_name
-                    })
-            
-            # Sort by memory usage (highest first)
-            self.process_list = sorted(self.process_list, key=lambda x: float(x['mem']), reverse=True)
-            
-            # Update dropdown values
-            process_values = [f"{p['pid']} - {p['name']} (CPU: {p['cpu']}%, MEM: {p['mem']}%)" 
-                            for p in self.process_list]
-            
-            # Update combobox
-            self.process_dropdown['values'] = process_values
-            if process_values and not self.selected_process.get():
-                self.process_dropdown.current(0)
-                
-            self.status_var.set(f"Found {len(self.process_list)} processes")
-            
+            processes = _scan_proc()
+            error = None
         except Exception as e:
-            self.status_var.set(f"Error: {str(e)}")
-            messagebox.showerror("Error", f"Failed to get process list: {str(e)}")
+            processes = []
+            error = str(e)
+        self.root.after(0, self._finish_process_scan, processes, error)
+
+    def _finish_process_scan(self, processes, error):
+        """Tk-thread half: cache the scan and refresh the dropdown."""
+        self._proc_scan_running = False
+        if error is not None:
+            self.status_var.set(f"Error: {error}")
+            messagebox.showerror("Error", f"Failed to get process list: {error}")
+            return
+        self._ps_cache = (time.monotonic(), processes)
+        self._apply_process_list(processes)
+
+    def _apply_process_list(self, processes):
+        """Push a scanned process table into the dropdown."""
+        self.process_list = processes
+
+        # Rewriting combobox values redraws its list widget, so skip the
+        # whole rebuild when the table has not actually changed
+        sig = hash(tuple(
+            (p['pid'], p['cpu'], p['mem'], p['name']) for p in processes
+        ))
+        if sig == self._last_proc_sig:
+            self.status_var.set(f"Found {len(self.process_list)} processes")
+            return
+        self._last_proc_sig = sig
+
+        # Update dropdown values
+        process_values = [f"{p['pid']} - {p['name']} (CPU: {p['cpu']}%, MEM: {p['mem']}%)"
+                        for p in self.process_list]
+
+        # Update combobox
+        self.process_dropdown['values'] = process_values
+        if process_values and not self.selected_process.get():
+            self.process_dropdown.current(0)
+
+        self.status_var.set(f"Found {len(self.process_list)} processes")
             
     def on_process_selected(self, event):
         """Handle process selection"""
@@ -261,60 +506,50 @@ class SimpleMemorySimulator:
     def get_process_memory_pages(self, pid):
         """Generate simulated memory page accesses based on actual process memory info"""
         try:
-            # Get memory stats for the process using ps
-            result = subprocess.run(
-                ['ps', '-o', 'pid,rss,vsz,command', '-p', pid], 
-                capture_output=True, 
-                text=True
-            )
-            
-            if result.returncode != 0:
-                raise ValueError(f"Failed to get info for PID {pid}")
-                
-            # Parse output, skip header
-            lines = result.stdout.strip().split('\n')
-            if len(lines) < 2:
+            # Read memory stats straight from /proc: two integers (total and
+            # resident pages), no process fork and no regex parsing
+            try:
+                with open(f'/proc/{pid}/statm') as f:
+                    size_pages, rss_pages, *_ = map(int, f.read().split())
+            except OSError:
                 raise ValueError(f"No process found with PID {pid}")
-                
-            # Split the line by whitespace
-            parts = re.split(r'\s+', lines[1].strip(), maxsplit=3)
-            if len(parts) < 3:
-                raise ValueError(f"Unexpected output format from ps command")
-                
-            # Extract RSS (Resident Set Size) and VSZ (Virtual Memory Size)
-            rss = int(parts[1])  # In KB
-            vsz = int(parts[2])  # In KB
+
+            # Convert page counts to KB, matching the old ps output
+            page_kb = os.sysconf('SC_PAGE_SIZE') // 1024
+            rss = rss_pages * page_kb  # Resident Set Size in KB
+            vsz = size_pages * page_kb  # Virtual Memory Size in KB
+            if vsz == 0:
+                raise ValueError(f"No memory info for PID {pid}")
             
             # Calculate the number of pages based on memory size
             page_size = 4096  # 4KB page size (standard on most systems)
             num_pages = min(10, max(4, int(rss / (1024 * 10))))
             
             # Generate a sequence with locality of reference based on real memory usage
-            sequence = []
-            hot_pages = list(range(1, min(5, num_pages) + 1))
-            cold_pages = list(range(min(5, num_pages) + 1, num_pages + 1))
-            
+            hot_pages = np.arange(1, min(5, num_pages) + 1)
+            cold_pages = np.arange(min(5, num_pages) + 1, num_pages + 1)
+            if cold_pages.size == 0:
+                cold_pages = np.arange(1, num_pages + 1)
+
             # Ratio of RSS to VSZ gives an idea of memory usage pattern
             locality_factor = min(0.8, max(0.2, rss / vsz))
-            
-            # Generate sequence with locality of reference
-            for i in range(30):  # Generate 30 page accesses
-                if random.random() < locality_factor:
-                    # Access a hot page (representing frequent access)
-                    if hot_pages:
-                        sequence.append(random.choice(hot_pages))
-                    else:
-                        sequence.append(1)  # Fallback if no hot pages
-                else:
-                    # Access a cold page or introduce a new page
-                    if i > 20 and random.random() < 0.3:
-                        # Occasionally introduce a page fault by accessing new page
-                        sequence.append(num_pages + 1 + len(set(sequence)))
-                    elif cold_pages:
-                        sequence.append(random.choice(cold_pages))
-                    else:
-                        sequence.append(random.choice(range(1, num_pages + 1)))
-                        
+
+            # Draw all 30 accesses in a handful of vectorized calls instead
+            # of per-access random.random()/random.choice()
+            n = 30
+            hot_mask = self._rng.random(n) < locality_factor
+            sequence = np.where(
+                hot_mask,
+                self._rng.choice(hot_pages, size=n) if hot_pages.size else 1,
+                self._rng.choice(cold_pages, size=n)
+            )
+            # Occasionally introduce page faults late in the run by touching
+            # brand-new pages
+            new_mask = ~hot_mask & (np.arange(n) > 20) & (self._rng.random(n) < 0.3)
+            sequence[new_mask] = num_pages + 1 + np.arange(int(new_mask.sum()))
+            sequence = np.ascontiguousarray(sequence, dtype=np.int32)
+
+
             self.status_var.set(f"Generated sequence based on PID {pid} (RSS: {rss}KB, VSZ: {vsz}KB)")
             return sequence
             
@@ -322,7 +557,7 @@ class SimpleMemorySimulator:
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showwarning("Warning", f"Couldn't get memory info for PID {pid}: {str(e)}")
             # Fallback to a default sequence
-            return [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+            return np.array([1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5], dtype=np.int32)
             
     def run_simulation(self):
         """Run the page replacement simulation"""
@@ -330,7 +565,9 @@ class SimpleMemorySimulator:
             # Clear previous results
             self.results_text.delete(1.0, tk.END)
             self.results_text.insert(tk.END, "Running simulation...\n\n")
-            self.root.update()
+            # Flush pending redraws only; a full update() re-enters the
+            # event loop and can re-dispatch user events mid-simulation
+            self.root.update_idletasks()
             
             # Get parameters
             frames = int(self.frames_var.get())
@@ -342,62 +579,98 @@ class SimpleMemorySimulator:
                 # Update sequence field for visibility
                 self.sequence_var.set(','.join(map(str, sequence)))
             else:
-                # Use manually entered sequence
-                sequence = [int(x.strip()) for x in self.sequence_var.get().split(',') if x.strip()]
-                
-            if not sequence:
+                # Use manually entered sequence, parsed in C by NumPy
+                # and cached per distinct entry text; kept as a contiguous
+                # int32 array so the kernels consume it without boxing
+                sequence = _parse_sequence(self.sequence_var.get())
+
+            if len(sequence) == 0:
                 self.results_text.insert(tk.END, "Error: No page sequence provided\n")
                 return
-                
-            # Run algorithm
-            algorithm = PageReplacementAlgorithm(frames)
-            
-            if self.algorithm_var.get() == "LRU":
-                faults, final_state, history = algorithm.lru_replace(sequence)
-            else:
-                faults, final_state, history = algorithm.optimal_replace(sequence)
-                
-            # Display results
-            self.show_text_results(sequence, history, faults, final_state)
-            
+
+            inputs = (self.algorithm_var.get(), frames, tuple(sequence))
+            if inputs == self._last_inputs:
+                # Same algorithm, frames and sequence: redisplay the
+                # previous run instead of simulating again
+                faults, final_state, state_log, fault_log = self._last_result
+                self.show_text_results(sequence, state_log, fault_log, faults, final_state)
+                return
+
+            # Simulate on the worker thread so long sequences never block
+            # the event loop; results come back through root.after
+            future = self._sim_pool.submit(
+                self._simulate, self.algorithm_var.get(), frames, sequence
+            )
+            future.add_done_callback(
+                lambda fut: self.root.after(0, self._on_sim_done, inputs, sequence, fut)
+            )
+
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
             self.results_text.insert(tk.END, f"Error: {str(e)}\n")
+
+    @staticmethod
+    def _simulate(algorithm_name, frames, sequence):
+        """Pure-compute half of run_simulation; safe to run off-thread."""
+        algorithm = PageReplacementAlgorithm(frames)
+        if algorithm_name == "LRU":
+            return algorithm.lru_replace(sequence)
+        return algorithm.optimal_replace(sequence)
+
+    def _on_sim_done(self, inputs, sequence, future):
+        """Tk-thread completion handler: cache and display the results."""
+        try:
+            faults, final_state, state_log, fault_log = future.result()
+        except Exception as e:
+            self.status_var.set(f"Error: {str(e)}")
+            self.results_text.insert(tk.END, f"Error: {str(e)}\n")
+            return
+
+        self._last_inputs = inputs
+        self._last_result = (faults, final_state, state_log, fault_log)
+        self.show_text_results(sequence, state_log, fault_log, faults, final_state)
             
-    def show_text_results(self, sequence, history, faults, final_state):
+    def show_text_results(self, sequence, state_log, fault_log, faults, final_state):
         """Display text-based results"""
         self.results_text.delete(1.0, tk.END)
-        
+
+        # Build the full report in memory and hand it to Tk in one insert
+        # call instead of one Tcl round-trip per row
+        lines = []
+
         # Get process info if available
         if self.selected_process.get():
-            self.results_text.insert(tk.END, f"Process: {self.selected_process.get()}\n\n")
-        
-        # Basic statistics
-        total_faults = sum(1 for h in history if h['fault'])
-        fault_rate = (total_faults / len(history)) * 100
-        
-        self.results_text.insert(tk.END, f"Algorithm: {self.algorithm_var.get()}\n")
-        self.results_text.insert(tk.END, f"Total Frames: {len(final_state)}\n")
-        self.results_text.insert(tk.END, f"Page Faults: {total_faults}\n")
-        self.results_text.insert(tk.END, f"Fault Rate: {fault_rate:.2f}%\n\n")
-        
+            lines.append(f"Process: {self.selected_process.get()}\n\n")
+
+        # Basic statistics: the simulation already counted faults, so no
+        # second pass over the log
+        total_faults = faults
+        fault_rate = (total_faults / len(sequence)) * 100
+
+        lines.append(f"Algorithm: {self.algorithm_var.get()}\n")
+        lines.append(f"Total Frames: {len(final_state)}\n")
+        lines.append(f"Page Faults: {total_faults}\n")
+        lines.append(f"Fault Rate: {fault_rate:.2f}%\n\n")
+
         # Show page access sequence
-        self.results_text.insert(tk.END, "Access Sequence:\n")
-        self.results_text.insert(tk.END, ' → '.join(map(str, sequence)) + "\n\n")
-        
+        lines.append("Access Sequence:\n")
+        lines.append(' → '.join(map(str, sequence)) + "\n\n")
+
         # Show memory state transitions
-        self.results_text.insert(tk.END, "Memory State Transitions:\n")
-        self.results_text.insert(tk.END, "Step | Access | Memory State | Fault\n")
-        self.results_text.insert(tk.END, "-----+--------+--------------+------\n")
-        
-        for i, h in enumerate(history):
-            fault_mark = "X" if h['fault'] else " "
-            state_str = "[" + ", ".join(str(x) if x != -1 else "_" for x in h['state']) + "]"
-            self.results_text.insert(tk.END, f"{i:4d} | {h['page']:6d} | {state_str:12s} | {fault_mark}\n")
-            
+        lines.append("Memory State Transitions:\n")
+        lines.append("Step | Access | Memory State | Fault\n")
+        lines.append("-----+--------+--------------+------\n")
+
+        for i, page in enumerate(sequence):
+            fault_mark = "X" if fault_log[i] else " "
+            state_str = "[" + ", ".join(str(x) if x != -1 else "_" for x in state_log[i]) + "]"
+            lines.append(f"{i:4d} | {page:6d} | {state_str:12s} | {fault_mark}\n")
+
         # Final state
-        self.results_text.insert(tk.END, f"\nFinal Memory State: {final_state}\n")
-        
+        lines.append(f"\nFinal Memory State: {final_state}\n")
+
+        self.results_text.insert(tk.END, ''.join(lines))
+
         # Update status
         self.status_var.set(f"Simulation completed - {total_faults} page faults detected")
 
@@ -0,0 +1,3 @@
+"""
+Virtual memory management simulator package.
+"""
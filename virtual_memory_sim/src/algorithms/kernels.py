@@ -0,0 +1,247 @@
+"""Numba-accelerated kernels for the page replacement simulations.
+
+Numba is optional: with it installed the kernels compile to native code
+via @njit(cache=True); without it the pure-Python loops in
+page_replacement.py are used. Page numbers are mapped to dense codes
+(0..num_pages-1) outside the kernels so all bookkeeping lives in flat
+int32 arrays.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernels stay importable without numba
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def lru_kernel(pages, codes, num_pages, total_frames):
+    n = codes.shape[0]
+    page_faults = 0
+
+    state_log = np.empty((n, total_frames), dtype=np.int32)
+    fault_log = np.empty(n, dtype=np.bool_)
+    frame_pages = np.full(total_frames, -1, dtype=np.int32)
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    # slot_of makes residency a single branchless load instead of a
+    # linear scan over the frame array
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    # Last-access timestamps: the LRU victim is the argmin over frames
+    last_access = np.zeros(total_frames, dtype=np.int64)
+    used = 0
+
+    for i in range(n):
+        state_log[i, :] = frame_pages
+        code = codes[i]
+        slot = slot_of[code]
+        if slot != -1:
+            fault_log[i] = False
+        else:
+            fault_log[i] = True
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                slot = 0
+                for f in range(1, total_frames):
+                    if last_access[f] < last_access[slot]:
+                        slot = f
+                slot_of[code_at_slot[slot]] = -1
+            frame_pages[slot] = pages[code]
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+        last_access[slot] = i + 1
+
+    return page_faults, frame_pages, state_log, fault_log
+
+
+@njit(cache=True)
+def optimal_kernel(pages, codes, num_pages, total_frames):
+    n = codes.shape[0]
+    page_faults = 0
+
+    # Reverse pass: next occurrence of each position (n means "never again")
+    next_occurrence = np.empty(n, dtype=np.int32)
+    last_seen = np.full(num_pages, n, dtype=np.int32)
+    for i in range(n - 1, -1, -1):
+        next_occurrence[i] = last_seen[codes[i]]
+        last_seen[codes[i]] = i
+
+    state_log = np.empty((n, total_frames), dtype=np.int32)
+    fault_log = np.empty(n, dtype=np.bool_)
+    frame_pages = np.full(total_frames, -1, dtype=np.int32)
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    next_use = np.full(total_frames, n, dtype=np.int32)
+    used = 0
+
+    for i in range(n):
+        state_log[i, :] = frame_pages
+        code = codes[i]
+        slot = slot_of[code]
+        if slot != -1:
+            fault_log[i] = False
+        else:
+            fault_log[i] = True
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                # Evict the resident page used farthest in the future
+                slot = 0
+                for f in range(1, total_frames):
+                    if next_use[f] > next_use[slot]:
+                        slot = f
+                slot_of[code_at_slot[slot]] = -1
+            frame_pages[slot] = pages[code]
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+        next_use[slot] = next_occurrence[i]
+
+    return page_faults, frame_pages, state_log, fault_log
+
+
+@njit(parallel=True, cache=True)
+def lru_fault_sweep(codes_flat, offsets, num_pages, total_frames):
+    """Count LRU faults for many sequences; runs are independent, so
+    each iteration of the outer prange loop goes to its own core."""
+    runs = offsets.shape[0] - 1
+    fault_counts = np.empty(runs, dtype=np.int64)
+    for r in prange(runs):
+        start = offsets[r]
+        end = offsets[r + 1]
+        slot_of = np.full(num_pages, -1, dtype=np.int32)
+        code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+        last_access = np.zeros(total_frames, dtype=np.int64)
+        used = 0
+        faults = 0
+        for i in range(start, end):
+            code = codes_flat[i]
+            slot = slot_of[code]
+            if slot == -1:
+                faults += 1
+                if used < total_frames:
+                    slot = used
+                    used += 1
+                else:
+                    slot = 0
+                    for f in range(1, total_frames):
+                        if last_access[f] < last_access[slot]:
+                            slot = f
+                    slot_of[code_at_slot[slot]] = -1
+                code_at_slot[slot] = code
+                slot_of[code] = slot
+            last_access[slot] = i - start + 1
+        fault_counts[r] = faults
+    return fault_counts
+
+
+@njit(parallel=True, cache=True)
+def optimal_fault_sweep(codes_flat, offsets, num_pages, total_frames):
+    """Count Optimal faults for many sequences in parallel."""
+    runs = offsets.shape[0] - 1
+    fault_counts = np.empty(runs, dtype=np.int64)
+    for r in prange(runs):
+        start = offsets[r]
+        end = offsets[r + 1]
+        n = end - start
+        next_occurrence = np.empty(n, dtype=np.int32)
+        last_seen = np.full(num_pages, n, dtype=np.int32)
+        for i in range(n - 1, -1, -1):
+            code = codes_flat[start + i]
+            next_occurrence[i] = last_seen[code]
+            last_seen[code] = i
+        slot_of = np.full(num_pages, -1, dtype=np.int32)
+        code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+        next_use = np.full(total_frames, n, dtype=np.int32)
+        used = 0
+        faults = 0
+        for i in range(n):
+            code = codes_flat[start + i]
+            slot = slot_of[code]
+            if slot == -1:
+                faults += 1
+                if used < total_frames:
+                    slot = used
+                    used += 1
+                else:
+                    slot = 0
+                    for f in range(1, total_frames):
+                        if next_use[f] > next_use[slot]:
+                            slot = f
+                    slot_of[code_at_slot[slot]] = -1
+                code_at_slot[slot] = code
+                slot_of[code] = slot
+            next_use[slot] = next_occurrence[i]
+        fault_counts[r] = faults
+    return fault_counts
+
+
+def sweep_fault_counts(page_sequences: List[List[int]], total_frames: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Fault counts for LRU and Optimal over many sequences at once.
+
+    The sequences are packed into one flat code array with offsets so
+    the sweeps can parallelize across cores; returns a pair of int64
+    arrays, one count per input sequence for each algorithm.
+    """
+    if not page_sequences:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    lengths = np.fromiter((len(s) for s in page_sequences), dtype=np.int64,
+                          count=len(page_sequences))
+    offsets = np.zeros(len(page_sequences) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.concatenate([np.asarray(s, dtype=np.int32) for s in page_sequences])
+    pages, codes = np.unique(flat, return_inverse=True)
+    codes = np.ascontiguousarray(codes, dtype=np.int32)
+    return (
+        lru_fault_sweep(codes, offsets, pages.size, total_frames),
+        optimal_fault_sweep(codes, offsets, pages.size, total_frames),
+    )
+
+
+def _encode(page_sequence: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+    seq = np.asarray(page_sequence, dtype=np.int32)
+    pages, codes = np.unique(seq, return_inverse=True)
+    return pages.astype(np.int32), np.ascontiguousarray(codes, dtype=np.int32)
+
+
+def lru_simulate(page_sequence: List[int], total_frames: int):
+    """Run the LRU kernel; returns (faults, memory, state_log, fault_log)."""
+    pages, codes = _encode(page_sequence)
+    faults, frame_pages, state_log, fault_log = lru_kernel(
+        pages, codes, pages.size, total_frames
+    )
+    return faults, [int(p) for p in frame_pages], state_log, fault_log
+
+
+def optimal_simulate(page_sequence: List[int], total_frames: int):
+    """Run the Optimal kernel; returns (faults, memory, state_log, fault_log)."""
+    pages, codes = _encode(page_sequence)
+    faults, frame_pages, state_log, fault_log = optimal_kernel(
+        pages, codes, pages.size, total_frames
+    )
+    return faults, [int(p) for p in frame_pages], state_log, fault_log
+
+
+if NUMBA_AVAILABLE:
+    # Pre-warm with a tiny sequence so the first user-triggered run hits
+    # already-compiled code; cache=True persists it across processes.
+    try:
+        _warmup_seq = [0, 1]
+        lru_simulate(_warmup_seq, 2)
+        optimal_simulate(_warmup_seq, 2)
+    except Exception:
+        pass
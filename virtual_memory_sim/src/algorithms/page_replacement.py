@@ -1,100 +1,182 @@
-from collections import OrderedDict
+import functools
+from collections import deque, namedtuple
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
+from . import kernels
+
+# Fixed-field record for one simulation step: lighter than a dict and
+# consumed via attribute access in the UI
+Step = namedtuple('Step', ['page_accessed', 'memory_state', 'page_fault'])
+
+class _HistoryView:
+    """Per-step history records materialized lazily from the kernel logs."""
+
+    def __init__(self, pages: List[int], state_log: np.ndarray, fault_log: np.ndarray):
+        self._pages = pages
+        self._state_log = state_log
+        self._fault_log = fault_log
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Step(
+            self._pages[index],
+            self._state_log[index].tolist(),
+            bool(self._fault_log[index])
+        )
+
 class PageReplacementAlgorithm:
     def __init__(self, total_frames: int):
         self.total_frames = total_frames
         self.page_faults = 0
         self.memory_state: List[int] = [-1] * total_frames
-        
+        # Frames never filled by the last run; maintained by the
+        # simulations so callers need not scan for the -1 sentinel
+        self.free_count = total_frames
+        # Per-run analytics logs: one state row per access plus a fault
+        # vector derived in a single vectorized pass after the loop
+        self.state_log = np.empty((0, total_frames), dtype=np.int32)
+        self.fault_log = np.empty(0, dtype=bool)
+
     def reset(self):
         self.page_faults = 0
         self.memory_state = [-1] * self.total_frames
+        self.free_count = self.total_frames
+
+    def _log_faults(self, page_sequence: List[int]):
+        """Derive the fault vector from the state log in one C-level pass."""
+        seq = np.asarray(page_sequence, dtype=np.int32).reshape(-1, 1)
+        self.fault_log = ~(self.state_log == seq).any(axis=1)
+
+    def _simulate_jit(self, kernel_fn, page_sequence: List[int]) -> Tuple[int, List[int], List[Dict]]:
+        """Run a JIT kernel and expose its array logs through the usual API."""
+        faults, memory, state_log, fault_log = kernel_fn(
+            page_sequence, self.total_frames
+        )
+        self.page_faults = faults
+        self.memory_state = memory
+        self.free_count = memory.count(-1)
+        self.state_log = state_log
+        self.fault_log = fault_log
+        # History dicts are built on demand; bulk consumers use the logs
+        history = _HistoryView(page_sequence, state_log, fault_log)
+        return faults, memory, history
 
 class LRUAlgorithm(PageReplacementAlgorithm):
     def __init__(self, total_frames: int):
         super().__init__(total_frames)
-        self.access_history = OrderedDict()
-        
+        self.frame_of: Dict[int, int] = {}
+        self.free_frames: deque = deque(range(total_frames))
+        # Per-frame last-access timestamps: the LRU victim is the argmin,
+        # so recency bookkeeping is one store per access
+        self.last_access = np.zeros(total_frames, dtype=np.int64)
+
     def simulate(self, page_sequence: List[int]) -> Tuple[int, List[int], List[Dict]]:
+        if kernels.NUMBA_AVAILABLE and page_sequence:
+            return self._simulate_jit(kernels.lru_simulate, page_sequence)
+
         self.reset()
-        self.access_history.clear()
-        history = []
-        
-        for page in page_sequence:
-            current_state = {
-                'page_accessed': page,
-                'memory_state': self.memory_state.copy(),
-                'page_fault': False
-            }
-            
-            if page not in self.memory_state:
+        self.frame_of.clear()
+        self.free_frames = deque(range(self.total_frames))
+        self.last_access = np.zeros(self.total_frames, dtype=np.int64)
+        self.state_log = np.empty((len(page_sequence), self.total_frames), dtype=np.int32)
+
+        for i, page in enumerate(page_sequence):
+            self.state_log[i] = self.memory_state
+
+            if page in self.frame_of:
+                index = self.frame_of[page]
+            else:
                 self.page_faults += 1
-                current_state['page_fault'] = True
-                
-                if -1 in self.memory_state:
+
+                if self.free_frames:
                     # There's an empty frame
-                    index = self.memory_state.index(-1)
+                    index = self.free_frames.popleft()
                 else:
-                    # Find least recently used page
-                    lru_page = next(iter(self.access_history))
-                    index = self.memory_state.index(lru_page)
-                    del self.access_history[lru_page]
-                
+                    # Evict the least recently used page
+                    index = int(self.last_access.argmin())
+                    del self.frame_of[self.memory_state[index]]
+
                 self.memory_state[index] = page
-            
-            # Update access history
-            if page in self.access_history:
-                del self.access_history[page]
-            self.access_history[page] = True
-            
-            history.append(current_state)
-            
+                self.frame_of[page] = index
+            self.last_access[index] = i + 1
+
+        self.free_count = len(self.free_frames)
+        self._log_faults(page_sequence)
+        history = _HistoryView(list(page_sequence), self.state_log, self.fault_log)
         return self.page_faults, self.memory_state, history
 
 class OptimalAlgorithm(PageReplacementAlgorithm):
     def __init__(self, total_frames: int):
         super().__init__(total_frames)
-        
-    def find_optimal_victim(self, current_pages: List[int], future_sequence: List[int]) -> int:
-        future_use = {page: float('inf') for page in current_pages if page != -1}
-        
-        for page in future_use:
-            try:
-                future_use[page] = future_sequence.index(page)
-            except ValueError:
-                pass
-                
-        return max(future_use.items(), key=lambda x: x[1])[0]
-    
+        self.frame_of: Dict[int, int] = {}
+        self.free_frames: deque = deque(range(total_frames))
+
+    def find_optimal_victim(self, current_pages: List[int], next_use: Dict[int, int]) -> int:
+        # Pick the resident page whose precomputed next use is farthest away
+        return max(
+            (page for page in current_pages if page != -1),
+            key=lambda page: next_use[page]
+        )
+
     def simulate(self, page_sequence: List[int]) -> Tuple[int, List[int], List[Dict]]:
+        if kernels.NUMBA_AVAILABLE and page_sequence:
+            return self._simulate_jit(kernels.optimal_simulate, page_sequence)
+
         self.reset()
-        history = []
-        
+        self.frame_of.clear()
+        self.free_frames = deque(range(self.total_frames))
+        n = len(page_sequence)
+
+        # Single forward pass collects each page's future access positions,
+        # so victim selection never rescans the remaining sequence
+        future_positions: Dict[int, deque] = {}
         for i, page in enumerate(page_sequence):
-            current_state = {
-                'page_accessed': page,
-                'memory_state': self.memory_state.copy(),
-                'page_fault': False
-            }
-            
-            if page not in self.memory_state:
+            future_positions.setdefault(page, deque()).append(i)
+
+        next_use: Dict[int, int] = {}  # resident page -> next access index (n = never)
+        self.state_log = np.empty((n, self.total_frames), dtype=np.int32)
+
+        for i, page in enumerate(page_sequence):
+            self.state_log[i] = self.memory_state
+            positions = future_positions[page]
+            positions.popleft()  # consume the current access
+            upcoming = positions[0] if positions else n
+
+            if page not in self.frame_of:
                 self.page_faults += 1
-                current_state['page_fault'] = True
-                
-                if -1 in self.memory_state:
+
+                if self.free_frames:
                     # There's an empty frame
-                    index = self.memory_state.index(-1)
+                    index = self.free_frames.popleft()
                 else:
                     # Find optimal victim
-                    victim = self.find_optimal_victim(
-                        self.memory_state,
-                        page_sequence[i+1:]
-                    )
-                    index = self.memory_state.index(victim)
-                
+                    victim = self.find_optimal_victim(self.memory_state, next_use)
+                    index = self.frame_of.pop(victim)
+                    del next_use[victim]
+
                 self.memory_state[index] = page
-            
-            history.append(current_state)
-            
+                self.frame_of[page] = index
+            next_use[page] = upcoming
+
+        self.free_count = len(self.free_frames)
+        self._log_faults(page_sequence)
+        history = _HistoryView(list(page_sequence), self.state_log, self.fault_log)
         return self.page_faults, self.memory_state, history
+
+@functools.lru_cache(maxsize=64)
+def simulate_cached(algorithm: PageReplacementAlgorithm, page_sequence: Tuple[int, ...]):
+    """Memoized simulation keyed by algorithm instance and sequence tuple.
+
+    Streamlit reruns the whole script on every widget change, so repeat
+    runs with the same inputs hit the cache and return instantly. The
+    logs are returned explicitly because a cache hit leaves the
+    instance's attributes untouched.
+    """
+    faults, memory, history = algorithm.simulate(list(page_sequence))
+    return faults, list(memory), history, algorithm.state_log, algorithm.fault_log
@@ -1,14 +1,11 @@
-import os
-import sys
-
-# Add the src directory to Python path
-src_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(os.path.dirname(src_dir))
-sys.path.insert(0, project_root)
-
 import streamlit as st
-from src.algorithms.page_replacement import LRUAlgorithm, OptimalAlgorithm
-from src.visualization.memory_viz import create_memory_visualization, create_page_fault_graph
+from src.algorithms.page_replacement import LRUAlgorithm, OptimalAlgorithm, simulate_cached
+from src.visualization.memory_viz import (
+    create_memory_visualization,
+    create_page_fault_graph,
+    update_memory_visualization,
+    update_page_fault_graph,
+)
 
 def parse_page_sequence(input_str: str) -> list:
     """Parse the input string into a list of page numbers."""
@@ -44,25 +41,44 @@ def main():
         ['LRU', 'Optimal']
     )
     
-    # Initialize algorithm
-    algorithm = LRUAlgorithm(total_frames) if algorithm_name == 'LRU' else OptimalAlgorithm(total_frames)
+    # Reuse algorithm instances across reruns so repeated runs skip
+    # re-initialization (and keep the compiled kernels warm)
+    algos = st.session_state.setdefault('algos', {})
+    key = (algorithm_name, total_frames)
+    algorithm = algos.get(key)
+    if algorithm is None:
+        algorithm = LRUAlgorithm(total_frames) if algorithm_name == 'LRU' else OptimalAlgorithm(total_frames)
+        algos[key] = algorithm
     
     if st.sidebar.button('Run Simulation'):
         sequence = parse_page_sequence(page_sequence)
         if sequence:
             with st.spinner('Running simulation...'):
-                page_faults, final_memory, history = algorithm.simulate(sequence)
+                # Memoized: repeat runs with the same inputs skip the
+                # simulation entirely
+                page_faults, final_memory, history, state_log, fault_log = simulate_cached(
+                    algorithm, tuple(sequence)
+                )
                 
                 # Display results in columns
                 col1, col2 = st.columns(2)
                 
+                # Reuse the figures across reruns: only the trace arrays
+                # are updated, the layouts are built once
+                if 'mem_fig' not in st.session_state:
+                    st.session_state.mem_fig = create_memory_visualization(final_memory, page_size)
+                    st.session_state.fault_fig = create_page_fault_graph(fault_log)
+                else:
+                    update_memory_visualization(st.session_state.mem_fig, final_memory)
+                    update_page_fault_graph(st.session_state.fault_fig, fault_log)
+
                 with col1:
                     st.metric('Page Faults', page_faults)
-                    st.plotly_chart(create_memory_visualization(final_memory, page_size))
-                
+                    st.plotly_chart(st.session_state.mem_fig)
+
                 with col2:
                     st.metric('Page Fault Rate', f"{(page_faults/len(sequence))*100:.2f}%")
-                    st.plotly_chart(create_page_fault_graph(history))
+                    st.plotly_chart(st.session_state.fault_fig)
                 
                 # Display page access sequence
                 st.subheader('Page Access Sequence')
@@ -72,8 +88,8 @@ def main():
                 st.subheader('Simulation History')
                 for i, state in enumerate(history):
                     st.text(
-                        f"Step {i+1}: Accessing Page {state['page_accessed']} "
-                        f"{'(Page Fault)' if state['page_fault'] else '(Hit)'}"
+                        f"Step {i+1}: Accessing Page {state.page_accessed} "
+                        f"{'(Page Fault)' if state.page_fault else '(Hit)'}"
                     )
 
 if __name__ == '__main__':
@@ -2,19 +2,27 @@ import plotly.graph_objects as go
 from typing import List, Dict
 import numpy as np
 
+def _memory_arrays(memory_state: List[int]):
+    """Build the color and label arrays in single C-level passes."""
+    arr = np.asarray(memory_state)
+    empty = arr == -1
+    colors = np.where(empty, '#e74c3c', '#2ecc71')
+    labels = np.where(empty, 'Empty', np.char.add('Page ', arr.astype(str)))
+    return arr, colors, labels
+
 def create_memory_visualization(memory_state: List[int], page_size: int) -> go.Figure:
     """Create a visualization of the current memory state."""
     fig = go.Figure()
-    
-    y_positions = np.arange(len(memory_state))
-    colors = ['#2ecc71' if x != -1 else '#e74c3c' for x in memory_state]
-    
+
+    arr, colors, labels = _memory_arrays(memory_state)
+    y_positions = np.arange(arr.size)
+
     fig.add_trace(go.Bar(
-        x=[1] * len(memory_state),
+        x=np.ones(arr.size, dtype=np.int8),
         y=y_positions,
         orientation='h',
         marker_color=colors,
-        text=[f'Page {x}' if x != -1 else 'Empty' for x in memory_state],
+        text=labels,
         textposition='inside',
         width=0.8
     ))
@@ -31,20 +39,40 @@ def create_memory_visualization(memory_state: List[int], page_size: int) -> go.F
     
     return fig
 
-def create_page_fault_graph(history: List[Dict]) -> go.Figure:
-    """Create a visualization of page faults over time."""
+def update_memory_visualization(fig: go.Figure, memory_state: List[int]) -> go.Figure:
+    """Refresh an existing memory-state figure in place.
+
+    Only the trace arrays change; the layout survives, so a figure kept
+    in session state is not rebuilt and reserialized from scratch on
+    every rerun.
+    """
+    arr, colors, labels = _memory_arrays(memory_state)
+    with fig.batch_update():
+        bar = fig.data[0]
+        bar.x = np.ones(arr.size, dtype=np.int8)
+        bar.y = np.arange(arr.size)
+        bar.marker.color = colors
+        bar.text = labels
+    return fig
+
+def create_page_fault_graph(fault_log: np.ndarray) -> go.Figure:
+    """Create a visualization of page faults over time.
+
+    Takes the boolean fault vector produced by the simulation, so no
+    per-step Python iteration over history dicts is needed.
+    """
     fig = go.Figure()
-    
-    x = list(range(len(history)))
-    y = [1 if state['page_fault'] else 0 for state in history]
-    
+
+    y = np.asarray(fault_log, dtype=np.int8)
+    x = np.arange(y.size)
+
     fig.add_trace(go.Scatter(
         x=x,
         y=y,
         mode='lines+markers',
         name='Page Faults',
         marker=dict(
-            color=['red' if fault else 'green' for fault in y],
+            color=np.where(y, 'red', 'green'),
             size=10
         )
     ))
@@ -62,5 +90,15 @@ def create_page_fault_graph(history: List[Dict]) -> go.Figure:
             tickvals=[0, 1]
         )
     )
-    
+
+    return fig
+
+def update_page_fault_graph(fig: go.Figure, fault_log: np.ndarray) -> go.Figure:
+    """Refresh an existing page-fault figure in place from the fault vector."""
+    y = np.asarray(fault_log, dtype=np.int8)
+    with fig.batch_update():
+        trace = fig.data[0]
+        trace.x = np.arange(y.size)
+        trace.y = y
+        trace.marker.color = np.where(y, 'red', 'green')
     return fig
@@ -29,12 +29,12 @@ class TestPageReplacement(unittest.TestCase):
         # Test LRU
         page_faults, final_memory, _ = self.lru.simulate(sequence)
         self.assertEqual(page_faults, 2)
-        self.assertEqual(final_memory.count(-1), 1)
-        
+        self.assertEqual(self.lru.free_count, 1)
+
         # Test Optimal
         page_faults, final_memory, _ = self.optimal.simulate(sequence)
         self.assertEqual(page_faults, 2)
-        self.assertEqual(final_memory.count(-1), 1)
+        self.assertEqual(self.optimal.free_count, 1)
 
 if __name__ == '__main__':
     unittest.main()
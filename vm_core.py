@@ -0,0 +1,197 @@
+"""Core simulation logic and figure builders shared by the app front ends.
+
+The three UIs (app.py, web_app.py, simple_app.py) historically carried
+their own copies of the replacement algorithms; the canonical versions
+live here so a fix lands once.
+"""
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+from collections import deque
+import heapq
+
+import vm_kernels
+
+# MemoryManager class to handle virtual memory operations
+class MemoryManager:
+    # No per-instance __dict__: the class is reinstantiated on every
+    # Streamlit rerun, so keep it small
+    __slots__ = ('total_frames', 'page_size', 'memory')
+
+    def __init__(self, total_frames, page_size):
+        self.total_frames = total_frames  # Total frames available in memory
+        self.page_size = page_size        # Size of each page
+        self.memory = [-1] * total_frames  # Initialize memory frames as empty
+
+    # If every distinct page fits in memory no eviction can occur, so the
+    # result is just the distinct pages in first-access order
+    def _no_eviction_result(self, page_sequence):
+        uniq, first_idx = np.unique(page_sequence, return_index=True)
+        if uniq.size > self.total_frames:
+            return None
+        order = uniq[np.argsort(first_idx)]
+        return int(uniq.size), [int(p) for p in order]
+
+    # Least Recently Used (LRU) page replacement algorithm
+    def lru_replace(self, page_sequence):
+        fast = self._no_eviction_result(page_sequence)
+        if fast is not None:
+            return fast
+
+        if vm_kernels.NUMBA_AVAILABLE and page_sequence:
+            return vm_kernels.lru_simulate(page_sequence, self.total_frames)
+
+        page_faults = 0
+        k = self.total_frames
+        # Recency order kept as a doubly linked list over frame slots
+        # (next_younger/next_older arrays), mirroring the JIT kernel: hits
+        # and evictions are O(1) pointer fixes with no per-access dict
+        # reordering, only a read of slot_of.
+        page_at_slot = [-1] * k
+        next_younger = [-1] * k
+        next_older = [-1] * k
+        slot_of = {}  # resident page -> frame slot
+        youngest = -1
+        oldest = -1
+        used = 0
+
+        for page in page_sequence:
+            slot = slot_of.get(page, -1)
+            if slot != -1:
+                # Hit: promote the slot to the youngest position
+                if slot != youngest:
+                    younger = next_younger[slot]
+                    older = next_older[slot]
+                    next_older[younger] = older
+                    if older != -1:
+                        next_younger[older] = younger
+                    else:
+                        oldest = younger
+                    next_younger[slot] = -1
+                    next_older[slot] = youngest
+                    next_younger[youngest] = slot
+                    youngest = slot
+                continue
+
+            page_faults += 1
+            if used < k:
+                slot = used
+                used += 1
+            else:
+                # Evict the oldest slot and reuse it
+                slot = oldest
+                oldest = next_younger[slot]
+                if oldest != -1:
+                    next_older[oldest] = -1
+                else:
+                    youngest = -1
+                del slot_of[page_at_slot[slot]]
+
+            page_at_slot[slot] = page
+            slot_of[page] = slot
+            next_younger[slot] = -1
+            next_older[slot] = youngest
+            if youngest != -1:
+                next_younger[youngest] = slot
+            youngest = slot
+            if oldest == -1:
+                oldest = slot
+
+        return page_faults, [p for p in page_at_slot if p != -1]
+
+    # Optimal page replacement algorithm
+    def optimal_replace(self, page_sequence):
+        fast = self._no_eviction_result(page_sequence)
+        if fast is not None:
+            return fast
+
+        if vm_kernels.NUMBA_AVAILABLE and page_sequence:
+            return vm_kernels.optimal_simulate(page_sequence, self.total_frames)
+
+        page_faults = 0
+        n = len(page_sequence)
+
+        # Precompute every page's future access positions so the victim
+        # search reads an index instead of scanning the rest of the sequence
+        future_positions = {}
+        for i, page in enumerate(page_sequence):
+            future_positions.setdefault(page, deque()).append(i)
+
+        next_use = {}  # resident page -> next access index (n means "never again")
+        memory = [-1] * self.total_frames  # fixed frame slots
+        slot_of = {}  # resident page -> frame index (doubles as resident set)
+        free_slots = list(range(self.total_frames - 1, -1, -1))
+        # Lazy max-heap of (-next_use, page): stale entries are skipped on
+        # pop, so victim selection is O(log k) instead of a scan of all
+        # resident pages
+        heap = []
+
+        for page in page_sequence:
+            positions = future_positions[page]
+            positions.popleft()  # consume the current access
+            upcoming = positions[0] if positions else n
+
+            if page not in slot_of:
+                page_faults += 1
+                if free_slots:
+                    idx = free_slots.pop()
+                else:
+                    # Replace the resident page used farthest in the future
+                    while True:
+                        neg_use, victim = heapq.heappop(heap)
+                        if victim in slot_of and next_use[victim] == -neg_use:
+                            break
+                    idx = slot_of.pop(victim)
+                    del next_use[victim]
+                memory[idx] = page
+                slot_of[page] = idx
+            next_use[page] = upcoming
+            heapq.heappush(heap, (-upcoming, page))
+
+        return page_faults, memory
+
+# Run a simulation, memoized so Streamlit reruns with identical inputs
+# return instantly instead of re-executing the algorithm
+@st.cache_data(show_spinner=False)
+def run_sim(total_frames, page_size, algorithm, seq_tuple):
+    memory_manager = MemoryManager(total_frames, page_size)
+    if algorithm == 'LRU':
+        return memory_manager.lru_replace(list(seq_tuple))
+    return memory_manager.optimal_replace(list(seq_tuple))
+
+# Visualization function for memory state using Plotly. The figure is a
+# pure function of its inputs; callers pass the memory state as a tuple
+# so the cache key is cheap to hash, and max_entries bounds the memo.
+@st.cache_data(show_spinner=False, max_entries=64)
+def create_memory_visualization(memory_state, page_size):
+    fig = go.Figure()
+
+    arr = np.asarray(memory_state, dtype=np.int32)
+    y_positions = np.arange(arr.size)
+    empty = arr == -1
+    # Color coding: green for occupied, red for empty
+    colors = np.where(empty, '#e74c3c', '#2ecc71')
+    labels = np.where(empty, 'Empty', np.char.add('Page ', arr.astype(str)))
+
+    fig.add_trace(go.Bar(
+        x=np.ones(arr.size),
+        y=y_positions,
+        orientation='h',
+        marker_color=colors,
+        text=labels,
+        textposition='inside',
+        width=0.8
+    ))
+    
+    fig.update_layout(
+        title='Memory State Visualization',
+        xaxis_title='Memory Pages',
+        yaxis_title='Frame Number',
+        showlegend=False,
+        height=400,
+        width=600,
+        yaxis={'autorange': 'reversed'}
+    )
+    
+    return fig
+
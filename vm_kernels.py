@@ -0,0 +1,496 @@
+"""JIT-compiled simulation kernels for large page sequences.
+
+Numba is optional: when it is installed the kernels below are compiled
+with @njit(cache=True) and the apps dispatch the hot simulation loops
+here; without it the pure-Python implementations in the apps are used
+instead. The kernels operate on dense page codes (0..num_pages-1) so all
+bookkeeping fits in flat int32 arrays (32-bit indices are plenty for
+page sequences and keep register and cache pressure down).
+"""
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        # No-op decorator so the kernels stay importable without numba
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@functools.lru_cache(maxsize=32)
+def specialized_lru_kernel(total_frames):
+    """Build an LRU kernel with total_frames frozen into the closure.
+
+    Numba treats closure variables as compile-time constants, so each
+    distinct frame count gets its own specialized machine code with fixed
+    loop bounds; the lru_cache keeps one compiled kernel per shape.
+
+    No cache=True here: numba's on-disk cache does not key on closure
+    values, so differently specialized kernels would collide in it.
+    """
+
+    @njit
+    def lru_kernel(codes, num_pages):
+        n = codes.shape[0]
+        page_faults = 0
+
+        code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+        slot_of = np.full(num_pages, -1, dtype=np.int32)
+        # Recency order as a doubly linked list over frame slots
+        next_older = np.full(total_frames, -1, dtype=np.int32)
+        next_younger = np.full(total_frames, -1, dtype=np.int32)
+        youngest = -1
+        oldest = -1
+        used = 0
+
+        for i in range(n):
+            code = codes[i]
+            slot = slot_of[code]
+            if slot != -1:
+                # Hit: promote the slot to the youngest position
+                if slot != youngest:
+                    younger = next_younger[slot]
+                    older = next_older[slot]
+                    next_older[younger] = older
+                    if older != -1:
+                        next_younger[older] = younger
+                    else:
+                        oldest = younger
+                    next_younger[slot] = -1
+                    next_older[slot] = youngest
+                    next_younger[youngest] = slot
+                    youngest = slot
+                continue
+
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                # Evict the oldest slot and reuse it
+                slot = oldest
+                oldest = next_younger[slot]
+                if oldest != -1:
+                    next_older[oldest] = -1
+                else:
+                    youngest = -1
+                slot_of[code_at_slot[slot]] = -1
+
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+            next_younger[slot] = -1
+            next_older[slot] = youngest
+            if youngest != -1:
+                next_younger[youngest] = slot
+            youngest = slot
+            if oldest == -1:
+                oldest = slot
+
+        return page_faults, code_at_slot
+
+    return lru_kernel
+
+
+@njit(cache=True)
+def optimal_kernel(codes, num_pages, total_frames):
+    n = codes.shape[0]
+    page_faults = 0
+
+    # Reverse pass: next occurrence of each position (n means "never again")
+    next_occurrence = np.empty(n, dtype=np.int32)
+    last_seen = np.full(num_pages, n, dtype=np.int32)
+    for i in range(n - 1, -1, -1):
+        next_occurrence[i] = last_seen[codes[i]]
+        last_seen[codes[i]] = i
+
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    next_use = np.full(total_frames, n, dtype=np.int32)
+    used = 0
+
+    for i in range(n):
+        code = codes[i]
+        slot = slot_of[code]
+        if slot == -1:
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                # Evict the resident page used farthest in the future
+                slot = 0
+                for s in range(1, total_frames):
+                    if next_use[s] > next_use[slot]:
+                        slot = s
+                slot_of[code_at_slot[slot]] = -1
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+        next_use[slot] = next_occurrence[i]
+
+    return page_faults, code_at_slot
+
+
+@njit(cache=True)
+def lru_replay_kernel(pages, codes, num_pages, total_frames):
+    """LRU with full per-step logs for the history-displaying UIs.
+
+    Recency is a doubly linked list over the frame slots (same scheme as
+    the non-logging kernel above), so hits and evictions are O(1)
+    pointer swaps rather than a scan over frames.
+    """
+    n = codes.shape[0]
+    page_faults = 0
+
+    state_log = np.empty((n, total_frames), dtype=np.int32)
+    fault_log = np.empty(n, dtype=np.bool_)
+    frame_pages = np.full(total_frames, -1, dtype=np.int32)
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    next_older = np.full(total_frames, -1, dtype=np.int32)
+    next_younger = np.full(total_frames, -1, dtype=np.int32)
+    youngest = -1
+    oldest = -1
+    used = 0
+
+    for i in range(n):
+        state_log[i, :] = frame_pages
+        code = codes[i]
+        slot = slot_of[code]
+        if slot != -1:
+            fault_log[i] = False
+            # Hit: promote the slot to the youngest position
+            if slot != youngest:
+                younger = next_younger[slot]
+                older = next_older[slot]
+                next_older[younger] = older
+                if older != -1:
+                    next_younger[older] = younger
+                else:
+                    oldest = younger
+                next_younger[slot] = -1
+                next_older[slot] = youngest
+                next_younger[youngest] = slot
+                youngest = slot
+            continue
+
+        fault_log[i] = True
+        page_faults += 1
+        if used < total_frames:
+            slot = used
+            used += 1
+        else:
+            # Evict the oldest slot and reuse it
+            slot = oldest
+            oldest = next_younger[slot]
+            if oldest != -1:
+                next_older[oldest] = -1
+            else:
+                youngest = -1
+            slot_of[code_at_slot[slot]] = -1
+
+        frame_pages[slot] = pages[code]
+        code_at_slot[slot] = code
+        slot_of[code] = slot
+        next_younger[slot] = -1
+        next_older[slot] = youngest
+        if youngest != -1:
+            next_younger[youngest] = slot
+        youngest = slot
+        if oldest == -1:
+            oldest = slot
+
+    return page_faults, frame_pages, state_log, fault_log
+
+
+@njit(cache=True)
+def optimal_replay_kernel(pages, codes, num_pages, total_frames):
+    """Optimal with full per-step logs for the history-displaying UIs."""
+    n = codes.shape[0]
+    page_faults = 0
+
+    # Reverse pass: next occurrence of each position (n means "never again")
+    next_occurrence = np.empty(n, dtype=np.int32)
+    last_seen = np.full(num_pages, n, dtype=np.int32)
+    for i in range(n - 1, -1, -1):
+        next_occurrence[i] = last_seen[codes[i]]
+        last_seen[codes[i]] = i
+
+    state_log = np.empty((n, total_frames), dtype=np.int32)
+    fault_log = np.empty(n, dtype=np.bool_)
+    frame_pages = np.full(total_frames, -1, dtype=np.int32)
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    next_use = np.full(total_frames, n, dtype=np.int32)
+    used = 0
+
+    for i in range(n):
+        state_log[i, :] = frame_pages
+        code = codes[i]
+        slot = slot_of[code]
+        if slot != -1:
+            fault_log[i] = False
+        else:
+            fault_log[i] = True
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                # Evict the resident page used farthest in the future
+                slot = 0
+                for s in range(1, total_frames):
+                    if next_use[s] > next_use[slot]:
+                        slot = s
+                slot_of[code_at_slot[slot]] = -1
+            frame_pages[slot] = pages[code]
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+        next_use[slot] = next_occurrence[i]
+
+    return page_faults, frame_pages, state_log, fault_log
+
+
+# Frame counts up to this bound get value-specialized replay kernels
+# with fixed loop bounds that LLVM fully unrolls
+_SMALL_FRAME_LIMIT = 8
+
+
+@functools.lru_cache(maxsize=_SMALL_FRAME_LIMIT)
+def specialized_lru_replay_kernel(total_frames):
+    """Build a logging LRU kernel with total_frames frozen into the closure.
+
+    Same specialization trick as specialized_lru_kernel: the typical
+    teaching configurations (4-8 frames) each get machine code with
+    literal loop bounds instead of a runtime frame count. Like
+    specialized_lru_kernel, these are compiled per process rather than
+    disk-cached: the cache cannot tell specializations apart.
+    """
+
+    @njit
+    def lru_replay_small(pages, codes, num_pages):
+        n = codes.shape[0]
+        page_faults = 0
+
+        state_log = np.empty((n, total_frames), dtype=np.int32)
+        fault_log = np.empty(n, dtype=np.bool_)
+        frame_pages = np.full(total_frames, -1, dtype=np.int32)
+        code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+        slot_of = np.full(num_pages, -1, dtype=np.int32)
+        next_older = np.full(total_frames, -1, dtype=np.int32)
+        next_younger = np.full(total_frames, -1, dtype=np.int32)
+        youngest = -1
+        oldest = -1
+        used = 0
+
+        for i in range(n):
+            state_log[i, :] = frame_pages
+            code = codes[i]
+            slot = slot_of[code]
+            if slot != -1:
+                fault_log[i] = False
+                if slot != youngest:
+                    younger = next_younger[slot]
+                    older = next_older[slot]
+                    next_older[younger] = older
+                    if older != -1:
+                        next_younger[older] = younger
+                    else:
+                        oldest = younger
+                    next_younger[slot] = -1
+                    next_older[slot] = youngest
+                    next_younger[youngest] = slot
+                    youngest = slot
+                continue
+
+            fault_log[i] = True
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                slot = oldest
+                oldest = next_younger[slot]
+                if oldest != -1:
+                    next_older[oldest] = -1
+                else:
+                    youngest = -1
+                slot_of[code_at_slot[slot]] = -1
+
+            frame_pages[slot] = pages[code]
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+            next_younger[slot] = -1
+            next_older[slot] = youngest
+            if youngest != -1:
+                next_younger[youngest] = slot
+            youngest = slot
+            if oldest == -1:
+                oldest = slot
+
+        return page_faults, frame_pages, state_log, fault_log
+
+    return lru_replay_small
+
+
+def lru_replay(page_sequence, total_frames):
+    """LRU via the logging kernel; returns (faults, memory, state_log, fault_log)."""
+    seq = np.asarray(page_sequence, dtype=np.int32)
+    pages, codes = np.unique(seq, return_inverse=True)
+    codes = np.ascontiguousarray(codes, dtype=np.int32)
+    if total_frames <= _SMALL_FRAME_LIMIT:
+        kernel = specialized_lru_replay_kernel(total_frames)
+        faults, frame_pages, state_log, fault_log = kernel(
+            pages.astype(np.int32), codes, pages.size
+        )
+    else:
+        faults, frame_pages, state_log, fault_log = lru_replay_kernel(
+            pages.astype(np.int32), codes, pages.size, total_frames
+        )
+    return faults, [int(p) for p in frame_pages], state_log, fault_log
+
+
+def optimal_replay(page_sequence, total_frames):
+    """Optimal via the logging kernel; returns (faults, memory, state_log, fault_log)."""
+    seq = np.asarray(page_sequence, dtype=np.int32)
+    pages, codes = np.unique(seq, return_inverse=True)
+    faults, frame_pages, state_log, fault_log = optimal_replay_kernel(
+        pages.astype(np.int32), np.ascontiguousarray(codes, dtype=np.int32),
+        pages.size, total_frames
+    )
+    return faults, [int(p) for p in frame_pages], state_log, fault_log
+
+
+def lru_simulate(page_sequence, total_frames):
+    """LRU simulation via the JIT kernel; returns (faults, final memory)."""
+    seq = np.asarray(page_sequence, dtype=np.int32)
+    pages, codes = np.unique(seq, return_inverse=True)
+    kernel = specialized_lru_kernel(total_frames)
+    faults, code_at_slot = kernel(
+        np.ascontiguousarray(codes, dtype=np.int32), pages.size
+    )
+    memory = [int(pages[c]) for c in code_at_slot if c != -1]
+    return faults, memory
+
+
+def optimal_simulate(page_sequence, total_frames):
+    """Optimal simulation via the JIT kernel; returns (faults, final memory)."""
+    seq = np.asarray(page_sequence, dtype=np.int32)
+    pages, codes = np.unique(seq, return_inverse=True)
+    faults, code_at_slot = optimal_kernel(
+        np.ascontiguousarray(codes, dtype=np.int32), pages.size, total_frames
+    )
+    memory = [int(pages[c]) for c in code_at_slot if c != -1]
+    return faults, memory
+
+
+@njit(cache=True)
+def _lru_fault_count(codes, num_pages, total_frames):
+    n = codes.shape[0]
+    page_faults = 0
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    last_access = np.zeros(total_frames, dtype=np.int64)
+    used = 0
+    for i in range(n):
+        code = codes[i]
+        slot = slot_of[code]
+        if slot == -1:
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                slot = 0
+                for f in range(1, total_frames):
+                    if last_access[f] < last_access[slot]:
+                        slot = f
+                slot_of[code_at_slot[slot]] = -1
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+        last_access[slot] = i + 1
+    return page_faults
+
+
+@njit(cache=True)
+def _optimal_fault_count(codes, num_pages, total_frames):
+    n = codes.shape[0]
+    page_faults = 0
+    next_occurrence = np.empty(n, dtype=np.int32)
+    last_seen = np.full(num_pages, n, dtype=np.int32)
+    for i in range(n - 1, -1, -1):
+        next_occurrence[i] = last_seen[codes[i]]
+        last_seen[codes[i]] = i
+    code_at_slot = np.full(total_frames, -1, dtype=np.int32)
+    slot_of = np.full(num_pages, -1, dtype=np.int32)
+    next_use = np.full(total_frames, n, dtype=np.int32)
+    used = 0
+    for i in range(n):
+        code = codes[i]
+        slot = slot_of[code]
+        if slot == -1:
+            page_faults += 1
+            if used < total_frames:
+                slot = used
+                used += 1
+            else:
+                slot = 0
+                for s in range(1, total_frames):
+                    if next_use[s] > next_use[slot]:
+                        slot = s
+                slot_of[code_at_slot[slot]] = -1
+            code_at_slot[slot] = code
+            slot_of[code] = slot
+        next_use[slot] = next_occurrence[i]
+    return page_faults
+
+
+@njit(parallel=True, cache=True)
+def _batch_kernel(codes2d, num_pages, total_frames, algo):
+    runs = codes2d.shape[0]
+    fault_counts = np.empty(runs, dtype=np.int64)
+    for r in prange(runs):
+        if algo == 0:
+            fault_counts[r] = _lru_fault_count(codes2d[r], num_pages, total_frames)
+        else:
+            fault_counts[r] = _optimal_fault_count(codes2d[r], num_pages, total_frames)
+    return fault_counts
+
+
+def simulate_batch(page_sequences, total_frames, algorithm='LRU'):
+    """Fault counts for a batch of equal-length sequences.
+
+    Takes a (runs, n) array of page numbers and returns one fault count
+    per row; the rows are independent, so the batch kernel distributes
+    them across cores with prange. Useful for benchmark sweeps where
+    only the counts matter.
+    """
+    seqs = np.asarray(page_sequences, dtype=np.int32)
+    if seqs.ndim != 2:
+        raise ValueError('page_sequences must be a 2-D (runs, n) array')
+    pages, codes = np.unique(seqs, return_inverse=True)
+    codes2d = np.ascontiguousarray(codes.reshape(seqs.shape), dtype=np.int32)
+    algo = 0 if algorithm == 'LRU' else 1
+    return _batch_kernel(codes2d, pages.size, total_frames, algo)
+
+
+if NUMBA_AVAILABLE:
+    # Pre-warm the single-run kernels with a tiny sequence so the first
+    # user-triggered simulation hits already-compiled code; thanks to
+    # cache=True later processes load the cached machine code instead of
+    # recompiling.
+    try:
+        _warmup_seq = [0, 1]
+        lru_simulate(_warmup_seq, 2)
+        optimal_simulate(_warmup_seq, 2)
+        lru_replay(_warmup_seq, 2)
+        optimal_replay(_warmup_seq, 2)
+    except Exception:
+        pass
@@ -2,12 +2,15 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-import plotly.express as px
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import psutil
-import random
 import time
 
+import vm_kernels
+
+# Vectorized generator for simulated page access sequences
+_rng = np.random.default_rng()
+
 # Set page config
 st.set_page_config(
     page_title="Virtual Memory Simulator",
@@ -16,8 +19,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for dark grey and orange theme
-st.markdown("""
+# Custom CSS for dark grey and orange theme; one module-level constant
+# so the rerun path re-sends a single interned string instead of
+# rebuilding it, and every rule lives in one place
+_CSS = """
 <style>
     .main {
         background-color: #1E1E1E;
@@ -133,18 +138,41 @@ st.markdown("""
         align-items: center;
         justify-content: center;
     }
+    /* Refresh button styling */
+    [data-testid="baseButton-secondary"]:has(div:contains("🔄 Refresh")) {
+        background-color: #FF8C00;
+        color: #1E1E1E;
+        font-weight: bold;
+        transition: all 0.3s ease;
+    }
+    [data-testid="baseButton-secondary"]:has(div:contains("🔄 Refresh")):hover {
+        background-color: #FFA500;
+        transform: scale(1.05);
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Page title
 st.title(" Virtual Memory Simulator")
 st.markdown("### Visualize page replacement algorithms in virtual memory management")
 
 # Function to get running processes
-@st.cache_data(ttl=5)  # Cache for 5 seconds
 def get_running_processes():
+    # Scan results keyed by 5-second time bucket and kept in session
+    # state, which survives the script re-execution every interaction
+    # triggers (a module-level dict would be rebound each rerun). Unlike
+    # st.cache_data(ttl=5) a hit hands back the cached list without the
+    # defensive deep copy; callers only read it
+    bucket = int(time.time() // 5)
+    cached = st.session_state.get('proc_cache')
+    if cached is not None and cached[0] == bucket:
+        return cached[1]
     processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
+    # cpu_percent is deliberately not sampled: the first call per process
+    # always reads 0.0 and still costs a /proc stat parse per pid
+    for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
         try:
             # Get process info
             proc_info = proc.info
@@ -158,14 +186,15 @@ def get_running_processes():
                     processes.append({
                         'pid': proc_info['pid'],
                         'name': proc_info['name'],
-                        'memory_mb': memory_mb,
-                        'cpu_percent': proc_info['cpu_percent']
+                        'memory_mb': memory_mb
                     })
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
     
     # Sort by memory usage (highest first)
-    return sorted(processes, key=lambda x: x['memory_mb'], reverse=True)
+    processes.sort(key=lambda x: x['memory_mb'], reverse=True)
+    st.session_state.proc_cache = (bucket, processes)
+    return processes
 
 # Function to generate page sequence from process
 def generate_process_page_sequence(process_info):
@@ -177,179 +206,208 @@ def generate_process_page_sequence(process_info):
     num_pages = min(10, max(4, int(memory_mb / 50)))
     
     # Create "hot" pages (frequently accessed)
-    hot_pages = list(range(1, min(5, num_pages) + 1))
-    
+    hot_pages = np.arange(1, min(5, num_pages) + 1)
+
     # Create "cold" pages (less frequently accessed)
-    cold_pages = list(range(min(5, num_pages) + 1, num_pages + 1))
-    
+    cold_pages = np.arange(min(5, num_pages) + 1, num_pages + 1)
+    if cold_pages.size == 0:
+        cold_pages = np.arange(1, num_pages + 1)
+
     # Locality factor based on memory size (larger processes tend to have more locality)
     locality_factor = min(0.8, max(0.2, 0.4 + (memory_mb / 1000)))
-    
-    # Generate sequence with locality of reference
-    sequence = []
-    for i in range(30):  # Generate 30 page accesses
-        if random.random() < locality_factor:
-            # Access a hot page (representing frequent access)
-            if hot_pages:
-                sequence.append(random.choice(hot_pages))
-            else:
-                sequence.append(1)  # Fallback if no hot pages
-        else:
-            # Access a cold page or introduce a new page
-            if i > 20 and random.random() < 0.3:
-                # Occasionally introduce a page fault by accessing new page
-                sequence.append(num_pages + 1 + len(set(sequence)))
-            elif cold_pages:
-                sequence.append(random.choice(cold_pages))
-            else:
-                sequence.append(random.choice(range(1, num_pages + 1)))
-    
-    return sequence
+
+    # Draw all 30 accesses with a handful of vectorized calls instead of
+    # per-access random.random()/random.choice()
+    n = 30
+    hot_mask = _rng.random(n) < locality_factor
+    sequence = np.where(
+        hot_mask,
+        _rng.choice(hot_pages, size=n),
+        _rng.choice(cold_pages, size=n)
+    )
+    # Occasionally introduce page faults late in the run by touching
+    # brand-new pages
+    new_mask = ~hot_mask & (np.arange(n) > 20) & (_rng.random(n) < 0.3)
+    sequence[new_mask] = num_pages + 1 + np.arange(int(new_mask.sum()))
+
+    return sequence.tolist()
 
 # Function to run LRU algorithm
 def lru_replacement(page_sequence, frame_count):
     memory = [-1] * frame_count
     page_faults = 0
-    access_history = OrderedDict()
-    history = []
-    
+    # page -> frame index; makes residency and eviction O(1) instead of
+    # scanning the frame list on every reference
+    page_to_frame = {}
+    free_frames = list(range(frame_count - 1, -1, -1))  # pop() fills frame 0 first
+    access_history = OrderedDict()  # recency order, oldest first
+    n = len(page_sequence)
+    # Per-step logs as preallocated arrays instead of one dict + list
+    # copy per step: page ids fit comfortably in int16
+    states = np.empty((n, frame_count), dtype=np.int16)
+    fault_log = np.empty(n, dtype=np.bool_)
+
     for step, page in enumerate(page_sequence):
-        current_state = memory.copy()
         is_fault = False
-        
-        if page not in memory:
+
+        if page not in page_to_frame:
             page_faults += 1
             is_fault = True
-            if -1 in memory:
+            if free_frames:
                 # Empty frame available
-                idx = memory.index(-1)
+                idx = free_frames.pop()
             else:
                 # Find least recently used
-                lru_page = next(iter(access_history))
-                idx = memory.index(lru_page)
-                del access_history[lru_page]
+                lru_page, _ = access_history.popitem(last=False)
+                idx = page_to_frame.pop(lru_page)
             memory[idx] = page
-        
+            page_to_frame[page] = idx
+
         # Update access history
-        if page in access_history:
-            del access_history[page]
         access_history[page] = True
-        
-        history.append({
-            'step': step,
-            'page': page,
-            'state': memory.copy(),
-            'fault': is_fault
-        })
-    
+        access_history.move_to_end(page)
+
+        states[step] = memory
+        fault_log[step] = is_fault
+
+    history = {
+        'page': np.asarray(page_sequence, dtype=np.int16),
+        'state': states,
+        'fault': fault_log
+    }
     return history, page_faults
 
 # Function to run Optimal algorithm
 def optimal_replacement(page_sequence, frame_count):
     memory = [-1] * frame_count
     page_faults = 0
-    history = []
-    
+    page_to_frame = {}
+    free_frames = list(range(frame_count - 1, -1, -1))
+    n = len(page_sequence)
+    states = np.empty((n, frame_count), dtype=np.int16)
+    fault_log = np.empty(n, dtype=np.bool_)
+
+    # One forward pass records every page's future access positions, so
+    # victim selection never rescans the remaining sequence
+    future_positions = {}
+    for i, page in enumerate(page_sequence):
+        future_positions.setdefault(page, deque()).append(i)
+
+    next_use = {}  # resident page -> next access index (n means "never")
+
     for step, page in enumerate(page_sequence):
-        current_state = memory.copy()
+        positions = future_positions[page]
+        positions.popleft()  # consume the current access
+        upcoming = positions[0] if positions else n
         is_fault = False
-        
-        if page not in memory:
+
+        if page not in page_to_frame:
             page_faults += 1
             is_fault = True
-            if -1 in memory:
+            if free_frames:
                 # Empty frame available
-                idx = memory.index(-1)
+                idx = free_frames.pop()
             else:
-                # Find page that won't be used for the longest time
-                future_use = {}
-                for p in memory:
-                    try:
-                        future_use[p] = page_sequence[step+1:].index(p) + 1
-                    except ValueError:
-                        future_use[p] = float('inf')
-                
-                victim = max(future_use.items(), key=lambda x: x[1])[0]
-                idx = memory.index(victim)
-            
+                # Evict the resident page used farthest in the future
+                victim = max(memory, key=next_use.__getitem__)
+                idx = page_to_frame.pop(victim)
+                del next_use[victim]
+
             memory[idx] = page
-        
-        history.append({
-            'step': step,
-            'page': page,
-            'state': memory.copy(),
-            'fault': is_fault
-        })
-    
+            page_to_frame[page] = idx
+        next_use[page] = upcoming
+
+        states[step] = memory
+        fault_log[step] = is_fault
+
+    history = {
+        'page': np.asarray(page_sequence, dtype=np.int16),
+        'state': states,
+        'fault': fault_log
+    }
     return history, page_faults
 
+def _history_from_replay(kernel_fn, page_sequence, frame_count):
+    """Run a logging kernel and reshape its logs into the history dict.
+
+    The kernels record the memory state *before* each reference while
+    the table and heatmap show it *after*, so shift the log up one row
+    and close with the final frame contents.
+    """
+    faults, memory, state_log, fault_log = kernel_fn(page_sequence, frame_count)
+    states = np.empty_like(state_log)
+    states[:-1] = state_log[1:]
+    states[-1] = memory
+    history = {
+        'page': np.asarray(page_sequence, dtype=np.int16),
+        'state': states,
+        'fault': fault_log
+    }
+    return history, faults
+
+# Run a simulation once per distinct input set: every sidebar widget
+# change reruns the whole script, so repeat runs with the same
+# algorithm, sequence and frame count come straight from the cache.
+# With numba present the compiled replay kernels do the stepping; the
+# pure-Python implementations above stay as the fallback.
+@st.cache_data(show_spinner=False)
+def run_sim(algorithm, page_sequence, frame_count):
+    if algorithm == "LRU (Least Recently Used)":
+        if vm_kernels.NUMBA_AVAILABLE and page_sequence:
+            return _history_from_replay(vm_kernels.lru_replay, page_sequence, frame_count)
+        return lru_replacement(list(page_sequence), frame_count)
+    if vm_kernels.NUMBA_AVAILABLE and page_sequence:
+        return _history_from_replay(vm_kernels.optimal_replay, page_sequence, frame_count)
+    return optimal_replacement(list(page_sequence), frame_count)
+
 # Function to create memory state visualization
+@st.cache_data(show_spinner=False)
 def create_memory_state_fig(history, frame_count):
-    # Extract memory states and create a 2D array
-    states = np.array([list(h['state']) for h in history])
-    
-    # Create a dataframe for visualization
-    data = []
-    for step in range(len(history)):
-        for frame in range(frame_count):
-            page = states[step, frame]
-            is_fault = history[step]['fault']
-            data.append({
-                'Step': step,
-                'Frame': f"Frame {frame}",
-                'Page': page if page != -1 else "Empty",
-                'Page_Int': page,
-                'Reference': history[step]['page'],
-                'Is_Fault': is_fault
-            })
-    
-    df = pd.DataFrame(data)
-    
-    # Create heatmap using plotly
-    fig = px.density_heatmap(
-        df, 
-        x='Step', 
-        y='Frame', 
-        z='Page_Int', 
-        color_continuous_scale=[(0, "#2D2D2D"), (0.5, "#805940"), (1, "#FF8C00")],
-        labels={'Step': 'Memory Access Step', 'Frame': 'Memory Frame', 'Page_Int': 'Page Number'},
-    )
-    
-    # Add text annotations for page numbers
-    for i, row in df.iterrows():
-        text = 'Empty' if row['Page'] == 'Empty' else str(int(row['Page']))
-        fig.add_annotation(
-            x=row['Step'],
-            y=row['Frame'],
-            text=text,
-            showarrow=False,
-            font=dict(color="white" if row['Page'] == 'Empty' else "black")
-        )
-    
+    # Memory states already live in a (steps, frames) int16 matrix
+    states = history['state'].T
+
+    # Cell labels rendered by the heatmap itself: one texttemplate
+    # instead of one layout annotation per cell
+    text = np.where(states == -1, 'Empty', states.astype(str))
+
+    fig = go.Figure(go.Heatmap(
+        z=states,
+        text=text,
+        texttemplate='%{text}',
+        textfont=dict(color='white'),
+        y=[f"Frame {frame}" for frame in range(frame_count)],
+        colorscale=[(0, "#2D2D2D"), (0.5, "#805940"), (1, "#FF8C00")],
+        showscale=False
+    ))
+
     # Customize layout
     fig.update_layout(
         title='Memory State Visualization',
+        xaxis_title='Memory Access Step',
+        yaxis_title='Memory Frame',
         paper_bgcolor='#1E1E1E',
         plot_bgcolor='#1E1E1E',
         font=dict(color='#E0E0E0'),
-        height=400,
-        coloraxis_showscale=False
+        height=400
     )
-    
+
     return fig
 
 # Function to create page fault visualization
+@st.cache_data(show_spinner=False)
 def create_page_fault_fig(history):
-    df = pd.DataFrame(history)
-    df['step'] = df.index
-    
+    steps = np.arange(len(history['page']))
+    pages = history['page']
+    fault_mask = history['fault']
+
     # Create figure
     fig = go.Figure()
     
-    # Add page references
-    fig.add_trace(go.Scatter(
-        x=df['step'],
-        y=df['page'],
+    # Add page references; Scattergl renders via WebGL, so long
+    # sequences don't pay per-point SVG node costs
+    fig.add_trace(go.Scattergl(
+        x=steps,
+        y=pages,
         mode='lines+markers',
         name='Page Reference',
         line=dict(color='#FF8C00', width=2),
@@ -357,10 +415,9 @@ def create_page_fault_fig(history):
     ))
     
     # Add page faults
-    fault_df = df[df['fault']].copy()
-    fig.add_trace(go.Scatter(
-        x=fault_df['step'],
-        y=fault_df['page'],
+    fig.add_trace(go.Scattergl(
+        x=steps[fault_mask],
+        y=pages[fault_mask],
         mode='markers',
         name='Page Fault',
         marker=dict(
@@ -404,12 +461,13 @@ def create_page_fault_fig(history):
     return fig
 
 # Function to display memory stack
+@st.cache_data(show_spinner=False)
 def display_memory_stack(history, frame_count):
-    if not history:
+    if history is None or len(history['page']) == 0:
         return
-    
+
     # Get the final state of memory
-    final_state = history[-1]['state']
+    final_state = history['state'][-1]
     
     # Create a figure
     fig = go.Figure()
@@ -449,12 +507,11 @@ def display_memory_stack(history, frame_count):
 
 # Initialize session state variables
 if 'history' not in st.session_state:
-    st.session_state.history = []
+    st.session_state.history = None
     st.session_state.page_faults = 0
     st.session_state.has_run = False
     st.session_state.selected_process = None
     st.session_state.process_sequence = []
-    st.session_state.last_refresh = time.time()
 
 # Create a sidebar for inputs
 with st.sidebar:
@@ -499,45 +556,23 @@ with st.sidebar:
         # Process selection section
         st.subheader("Select Running Process")
         
+        # Refresh via an on_click callback: it runs before the rerun the
+        # click itself triggers, so no explicit st.rerun is needed
+        def _refresh_processes():
+            st.session_state.proc_cache = None
+            st.session_state.selected_process = None
+
         # Add refresh button with better styling and responsiveness
         refresh_col1, refresh_col2 = st.columns([3, 1])
         with refresh_col2:
-            refresh_button = st.button(
+            st.button(
                 "🔄 Refresh",
                 help="Refresh the list of running processes",
                 use_container_width=True,
-                key="refresh_processes"
-            )
-            
-            # Add custom HTML for refresh button animation
-            st.markdown(
-                """
-                <style>
-                [data-testid="baseButton-secondary"]:has(div:contains("🔄 Refresh")) {
-                    background-color: #FF8C00;
-                    color: #1E1E1E;
-                    font-weight: bold;
-                    transition: all 0.3s ease;
-                }
-                [data-testid="baseButton-secondary"]:has(div:contains("🔄 Refresh")):hover {
-                    background-color: #FFA500;
-                    transform: scale(1.05);
-                }
-                </style>
-                """,
-                unsafe_allow_html=True
+                key="refresh_processes",
+                on_click=_refresh_processes
             )
             
-            if refresh_button:
-                # Force cache invalidation by updating the timestamp
-                st.session_state.last_refresh = time.time()
-                st.session_state.selected_process = None
-                st.rerun()  # Force a rerun to immediately show changes
-        
-        # Get running processes with the current timestamp to ensure refreshes work
-        if 'last_refresh' not in st.session_state:
-            st.session_state.last_refresh = time.time()
-            
         # Get running processes
         processes = get_running_processes()
         
@@ -578,45 +613,31 @@ with st.sidebar:
         # Show process count
         st.caption(f"Showing {display_count} of {len(filtered_processes)} processes")
         
-        # Create a container with scrolling for the process list
-        st.markdown('<div class="process-list-container">', unsafe_allow_html=True)
-        process_container = st.container()
-        
-        # Display processes
-        with process_container:
-            for i, proc in enumerate(filtered_processes[:display_count]):
-                # Create a clickable process item
-                selected_class = " selected-process" if st.session_state.selected_process == proc['pid'] else ""
-                
-                # Use columns for better layout
-                col1, col2 = st.columns([5, 1])
-                
-                with col1:
-                    # Display process info
-                    st.markdown(
-                        f"""
-                        <div class="process-item{selected_class}" id="proc-{proc['pid']}">
-                            <div class="process-name">{proc['name']} (PID: {proc['pid']})</div>
-                            <div class="process-details">
-                                Memory: {proc['memory_mb']:.2f} MB | CPU: {proc['cpu_percent']:.1f}%
-                            </div>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
-                
-                # Make it clickable
-                with col2:
-                    # Centered select button
-                    if st.button(f"Select", key=f"btn-{proc['pid']}", use_container_width=True):
-                        st.session_state.selected_process = proc['pid']
-                        # Generate sequence based on the process
-                        st.session_state.process_sequence = generate_process_page_sequence(proc)
-                        # Force refresh to show selected process details immediately
-                        st.rerun()
-        
-        # Close the scrollable container
-        st.markdown('</div>', unsafe_allow_html=True)
+        # One selectable dataframe instead of a markdown block and a
+        # button widget per process row
+        displayed = filtered_processes[:display_count]
+        df_proc = pd.DataFrame(displayed)
+        event = st.dataframe(
+            df_proc,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config={
+                'pid': 'PID',
+                'name': 'Process',
+                'memory_mb': st.column_config.NumberColumn('Memory (MB)', format='%.2f')
+            },
+            key="process_table"
+        )
+
+        # Row selection arrives with the rerun the click already caused
+        if event.selection.rows:
+            proc = displayed[event.selection.rows[0]]
+            if st.session_state.selected_process != proc['pid']:
+                st.session_state.selected_process = proc['pid']
+                # Generate sequence based on the process
+                st.session_state.process_sequence = generate_process_page_sequence(proc)
         
         # If a process is selected, show its details and generated sequence
         if st.session_state.selected_process:
@@ -629,7 +650,7 @@ with st.sidebar:
                 <div class="process-item selected-process">
                     <div class="process-name">{selected_proc['name']} (PID: {selected_proc['pid']})</div>
                     <div class="process-details">
-                        Memory: {selected_proc['memory_mb']:.2f} MB | CPU: {selected_proc['cpu_percent']:.1f}%
+                        Memory: {selected_proc['memory_mb']:.2f} MB
                     </div>
                 </div>
                 """, unsafe_allow_html=True)
@@ -644,10 +665,17 @@ with st.sidebar:
                     height=100
                 )
                 
-                # Option to regenerate sequence
-                if st.button("Regenerate Sequence", key="regenerate_btn"):
-                    st.session_state.process_sequence = generate_process_page_sequence(selected_proc)
-                    st.rerun()
+                # Option to regenerate sequence; the callback mutates
+                # session state before the click's own rerun renders
+                def _regenerate_sequence(proc):
+                    st.session_state.process_sequence = generate_process_page_sequence(proc)
+
+                st.button(
+                    "Regenerate Sequence",
+                    key="regenerate_btn",
+                    on_click=_regenerate_sequence,
+                    args=(selected_proc,)
+                )
                 
                 # Use this sequence
                 page_sequence = st.session_state.process_sequence
@@ -671,11 +699,27 @@ with st.sidebar:
             "Enter comma-separated page numbers:",
             "1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5"
         )
-        try:
-            page_sequence = [int(x.strip()) for x in sequence_input.split(',') if x.strip()]
-        except ValueError:
+        # Parsed in C by NumPy, wide and range-checked before narrowing
+        # to the int16 the history arrays use: fromstring with a small
+        # dtype would wrap out-of-range values silently, it reads
+        # whitespace-only input as a single zero, and malformed input
+        # either raises or comes back empty depending on the numpy
+        # version
+        if not sequence_input.strip():
+            parsed = np.empty(0, dtype=np.int64)
+        else:
+            try:
+                parsed = np.fromstring(sequence_input, sep=',', dtype=np.int64)
+            except ValueError:
+                parsed = np.empty(0, dtype=np.int64)
+        if parsed.size == 0 and sequence_input.strip():
             st.error("Please enter valid integers separated by commas.")
             page_sequence = []
+        elif parsed.size and (parsed.min() < 0 or parsed.max() > np.iinfo(np.int16).max):
+            st.error(f"Page numbers must be between 0 and {np.iinfo(np.int16).max}.")
+            page_sequence = []
+        else:
+            page_sequence = parsed.astype(np.int16).tolist()
     
     # Run button
     simulate = st.button("▶️ Run Simulation")
@@ -683,10 +727,9 @@ with st.sidebar:
 # Main content area
 if simulate or st.session_state.has_run:
     if simulate:  # Only recalculate if the button was just pressed
-        if algorithm == "LRU (Least Recently Used)":
-            st.session_state.history, st.session_state.page_faults = lru_replacement(page_sequence, frames)
-        else:  # Optimal
-            st.session_state.history, st.session_state.page_faults = optimal_replacement(page_sequence, frames)
+        st.session_state.history, st.session_state.page_faults = run_sim(
+            algorithm, tuple(page_sequence), frames
+        )
         st.session_state.has_run = True
     
     # Display metrics
@@ -705,8 +748,11 @@ if simulate or st.session_state.has_run:
         st.markdown('<div class="metric-container"><p class="metric-label">Fault Rate</p><p class="metric-value">' + 
                     f"{fault_rate:.2f}%" + '</p></div>', unsafe_allow_html=True)
     
-    # Memory state visualization
-    st.plotly_chart(create_memory_state_fig(st.session_state.history, frames), use_container_width=True)
+    # Memory state visualization; rendered static so the browser skips
+    # plotly's interaction layer on what is effectively an image
+    st.plotly_chart(create_memory_state_fig(st.session_state.history, frames),
+                    use_container_width=True,
+                    config={'staticPlot': True, 'displayModeBar': False})
     
     # Page fault visualization
     st.plotly_chart(create_page_fault_fig(st.session_state.history), use_container_width=True)
@@ -715,23 +761,34 @@ if simulate or st.session_state.has_run:
     col1, col2 = st.columns([1, 2])
     
     with col1:
-        # Memory stack visualization
-        st.plotly_chart(display_memory_stack(st.session_state.history, frames), use_container_width=True)
+        # Memory stack visualization (static, like the state heatmap)
+        st.plotly_chart(display_memory_stack(st.session_state.history, frames),
+                        use_container_width=True,
+                        config={'staticPlot': True, 'displayModeBar': False})
     
     with col2:
-        # Create table of steps
-        df = pd.DataFrame(st.session_state.history)
-        df['state'] = df['state'].apply(lambda x: ', '.join([str(i) if i != -1 else '_' for i in x]))
-        df['fault'] = df['fault'].apply(lambda x: '✓' if x else '')
-        
-        # Rename columns for display
-        df = df.rename(columns={
-            'step': 'Step',
-            'page': 'Page Referenced',
-            'state': 'Memory State',
-            'fault': 'Page Fault'
+        # Create table of steps straight from the history arrays,
+        # windowed so long runs don't ship the whole table (and build
+        # row strings) on every rerun
+        history = st.session_state.history
+        n = len(history['page'])
+        max_rows = 50
+        if n > max_rows:
+            start = st.slider("View step window", 0, n - max_rows, 0)
+        else:
+            start = 0
+        window = slice(start, start + max_rows)
+
+        df = pd.DataFrame({
+            'Step': np.arange(start, min(start + max_rows, n)),
+            'Page Referenced': history['page'][window],
+            'Memory State': [
+                ', '.join(str(x) if x != -1 else '_' for x in row)
+                for row in history['state'][window]
+            ],
+            'Page Fault': np.where(history['fault'][window], '✓', '')
         })
-        
+
         # Style the dataframe
         st.dataframe(
             df,